@@ -0,0 +1,6 @@
+from django.db import models
+
+
+class ReviewManager(models.Manager):
+    def get_queryset(self):
+        return super().get_queryset().select_related('document', 'user')
@@ -0,0 +1,28 @@
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ('document_reviews', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='review',
+            index=models.Index(
+                fields=['document', '-submit_date'],
+                name='review_document_submit_idx'
+            ),
+        ),
+        migrations.AlterField(
+            model_name='review',
+            name='document',
+            field=models.ForeignKey(
+                db_index=False,
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name='reviews', to='documents.Document',
+                verbose_name='Document'
+            ),
+        ),
+    ]
@@ -13,6 +13,7 @@ from .events import (
     event_document_review_created, event_document_review_deleted,
     event_document_review_edited
 )
+from .managers import ReviewManager
 
 logger = logging.getLogger(name=__name__)
 
@@ -22,10 +23,11 @@ class Review(models.Model):
     Model to store one review per document per user per date & time.
     """
     _event_created_event = event_document_review_created
-    _event_edited_event = event_document_review_created
+    _event_edited_event = event_document_review_edited
 
+    # Indexed by the (document, -submit_date) composite index.
     document = models.ForeignKey(
-        db_index=True, on_delete=models.CASCADE, related_name='reviews',
+        db_index=False, on_delete=models.CASCADE, related_name='reviews',
         to=Document, verbose_name=_('Document')
     )
     user = models.ForeignKey(
@@ -38,8 +40,17 @@ class Review(models.Model):
         verbose_name=_('Date time submitted')
     )
 
+    objects = ReviewManager()
+    objects_raw = models.Manager()
+
     class Meta:
         get_latest_by = 'submit_date'
+        indexes = (
+            models.Index(
+                fields=('document', '-submit_date'),
+                name='review_document_submit_idx'
+            ),
+        )
         ordering = ('-submit_date',)
         verbose_name = _('Review')
         verbose_name_plural = _('Reviews')
@@ -533,6 +533,9 @@ class DocumentsApp(MayanAppConfig):
         model_query_fields_document_version.add_select_related_field(
             field_name='document'
         )
+        model_query_fields_document_version.add_select_related_field(
+            field_name='document__document_type'
+        )
 
         # Document
 
@@ -638,7 +641,7 @@ class DocumentsApp(MayanAppConfig):
             widget=ThumbnailWidget
         )
         SourceColumn(
-            func=lambda context: context['object'].pages.count(),
+            func=lambda context: context['object'].version_pages.count(),
             include_label=True, label=_('Pages'), order=-8,
             source=DocumentVersion
         )
@@ -176,13 +176,12 @@ class FavoriteDocumentManager(models.Manager):
 class RecentlyAccessedDocumentManager(models.Manager):
     def add_document_for_user(self, user, document):
         if user.is_authenticated:
-            new_recent, created = self.model.objects.get_or_create(
-                user=user, document=document
-            )
-            if not created:
-                # document already in the recent list, just save to force
-                # accessed date and time update
-                new_recent.save()
+            # Refresh the accessed date and time of an existing entry with a
+            # single UPDATE. The list does not grow, no trimming is needed.
+            if self.filter(user=user, document=document).update(datetime_accessed=now()):
+                return
+
+            self.model.objects.create(user=user, document=document)
 
             recent_to_delete = self.filter(user=user).values_list(
                 'pk', flat=True
@@ -191,7 +190,6 @@ class RecentlyAccessedDocumentManager(models.Manager):
             ]
 
             self.filter(pk__in=list(recent_to_delete)).delete()
-        return new_recent
 
     def get_by_natural_key(
         self, datetime_accessed, document_natural_key, user_natural_key
@@ -7,7 +7,7 @@ from django.apps import apps
 from django.contrib.contenttypes.models import ContentType
 from django.db import models, transaction
 from django.urls import reverse
-from django.utils.functional import cached_property
+from django.utils.functional import SimpleLazyObject, cached_property
 from django.utils.translation import ugettext_lazy as _
 
 from mayan.apps.common.classes import ModelQueryFields
@@ -37,6 +37,19 @@ from .document_models import Document
 __all__ = ('DocumentVersion', 'DocumentVersionSearchResult')
 logger = logging.getLogger(name=__name__)
 
+# The label is rendered for every row of the version lists. Compile the
+# templates once, on first use, instead of on every call.
+template_label = SimpleLazyObject(
+    lambda: Template(
+        template_string='{{ instance.document }} ({{ instance.timestamp }})'
+    )
+)
+template_label_preserve_extension = SimpleLazyObject(
+    lambda: Template(
+        template_string='{{ filename }} ({{ instance.timestamp }}){{ extension }}'
+    )
+)
+
 
 class DocumentVersion(ExtraDataModelMixin, models.Model):
     document = models.ForeignKey(
@@ -201,9 +214,7 @@ class DocumentVersion(ExtraDataModelMixin, models.Model):
     def get_label(self, preserve_extension=False):
         if preserve_extension:
             filename, extension = os.path.splitext(self.document.label)
-            return Template(
-                template_string='{{ filename }} ({{ instance.timestamp }}){{ extension }}'
-            ).render(
+            return template_label_preserve_extension.render(
                 context={
                     'extension': extension,
                     'filename': filename,
@@ -211,11 +222,7 @@ class DocumentVersion(ExtraDataModelMixin, models.Model):
                 }
             )
         else:
-            return Template(
-                template_string='{{ instance.document }} ({{ instance.timestamp }})'
-            ).render(
-                context={'instance': self}
-            )
+            return template_label.render(context={'instance': self})
     get_label.short_description = _('Label')
 
     def get_source_content_object_dictionary_list(self):
@@ -43,6 +43,10 @@ queue_documents.add_task_type(
     dotted_path='mayan.apps.documents.tasks.task_document_version_page_list_reset',
     label=_('Reset the page list of a document version')
 )
+queue_documents.add_task_type(
+    dotted_path='mayan.apps.documents.tasks.task_document_version_event_viewed_commit',
+    label=_('Record the view of a document version')
+)
 queue_documents.add_task_type(
     dotted_path='mayan.apps.documents.tasks.task_document_version_export',
     label=_('Export a document version')
@@ -73,6 +77,10 @@ queue_uploads.add_task_type(
     dotted_path='mayan.apps.documents.tasks.task_document_file_page_count_update',
     label=_('Update document page count')
 )
+queue_uploads.add_task_type(
+    dotted_path='mayan.apps.documents.tasks.task_document_file_page_count_update_bulk',
+    label=_('Update the page count of multiple documents')
+)
 queue_uploads.add_task_type(
     dotted_path='mayan.apps.documents.tasks.task_document_file_upload',
     label=_('Upload new document file')
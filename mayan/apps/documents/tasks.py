@@ -7,6 +7,7 @@ from django.db import OperationalError
 from mayan.apps.lock_manager.exceptions import LockError
 from mayan.celery import app
 
+from .events import event_document_viewed
 from .literals import (
     UPDATE_PAGE_COUNT_RETRY_DELAY, UPLOAD_NEW_VERSION_RETRY_DELAY
 )
@@ -54,6 +55,37 @@ def task_document_file_page_count_update(self, document_file_id):
         raise self.retry(exc=exception)
 
 
+@app.task(ignore_result=True)
+def task_document_file_page_count_update_bulk(document_file_id_list):
+    DocumentFile = apps.get_model(
+        app_label='documents', model_name='DocumentFile'
+    )
+
+    queryset = DocumentFile.objects.filter(pk__in=document_file_id_list)
+
+    for document_file in queryset:
+        # Isolate each document file so that an error in one does not
+        # stop the rest of the chunk. Transient errors are handed to the
+        # single document file task which has its own retry logic.
+        try:
+            document_file.page_count_update()
+        except (LockError, OperationalError) as exception:
+            logger.warning(
+                'Transient error updating the page count for document '
+                'file: %s; %s. Queuing individual retry.', document_file,
+                exception
+            )
+            task_document_file_page_count_update.apply_async(
+                countdown=UPDATE_PAGE_COUNT_RETRY_DELAY,
+                kwargs={'document_file_id': document_file.pk}
+            )
+        except Exception as exception:
+            logger.error(
+                'Error updating the page count for document file: %s; %s',
+                document_file, exception, exc_info=True
+            )
+
+
 @app.task(
     bind=True,
     default_retry_delay=setting_task_document_file_page_image_generate_retry_delay.value
@@ -196,6 +228,30 @@ def task_document_version_page_list_reset(document_version_id):
     document_version.pages_reset()
 
 
+@app.task(ignore_result=True)
+def task_document_version_event_viewed_commit(
+    document_version_id, user_id=None
+):
+    DocumentVersion = apps.get_model(
+        app_label='documents', model_name='DocumentVersion'
+    )
+    User = get_user_model()
+
+    if user_id:
+        user = User.objects.get(pk=user_id)
+    else:
+        user = None
+
+    document_version = DocumentVersion.objects.select_related(
+        'document'
+    ).get(pk=document_version_id)
+
+    event_document_viewed.commit(
+        actor=user, action_object=document_version,
+        target=document_version.document
+    )
+
+
 @app.task(ignore_result=True)
 def task_document_version_export(
     document_version_id, organization_installation_url=None, user_id=None
@@ -197,6 +197,16 @@ class DocumentFilePageViewTestMixin:
             data={'id_list': self.test_document_file.pk}
         )
 
+    def _request_test_document_file_multiple_page_count_update_view_all(self):
+        return self.post(
+            viewname='documents:document_file_multiple_page_count_update',
+            data={
+                'id_list': ','.join(
+                    str(test_document.file_latest.pk) for test_document in self.test_documents
+                )
+            }
+        )
+
     def _request_test_document_file_page_list_view(self):
         return self.get(
             viewname='documents:document_file_page_list', kwargs={
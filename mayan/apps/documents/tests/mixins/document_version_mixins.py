@@ -1,5 +1,7 @@
 from django.contrib.contenttypes.models import ContentType
+from django.db import connection
 from django.db.models import Q
+from django.test.utils import CaptureQueriesContext
 
 from mayan.apps.converter.layers import layer_saved_transformations
 
@@ -215,6 +217,12 @@ class DocumentVersionViewTestMixin:
             }
         )
 
+    def _request_test_document_version_list_view_with_queries(self):
+        with CaptureQueriesContext(connection=connection) as queries:
+            response = self._request_test_document_version_list_view()
+
+        return response, queries
+
     def _request_test_document_version_preview_view(self):
         return self.get(
             viewname='documents:document_version_preview', kwargs={
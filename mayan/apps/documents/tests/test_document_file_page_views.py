@@ -1,3 +1,5 @@
+import mock
+
 from django.utils.encoding import force_text
 
 from ..permissions import (
@@ -71,6 +73,36 @@ class DocumentFilePageViewTestCase(
 
         self.assertNotEqual(self.test_document_file.pages.count(), page_count)
 
+    @mock.patch(
+        'mayan.apps.documents.views.document_file_page_views.UPDATE_PAGE_COUNT_BULK_CHUNK_SIZE',
+        1
+    )
+    @mock.patch(
+        'mayan.apps.documents.views.document_file_page_views.task_document_file_page_count_update_bulk.apply_async'
+    )
+    def test_document_file_multiple_page_count_update_view_chunking(
+        self, mock_apply_async
+    ):
+        self._upload_test_document()
+
+        for test_document in self.test_documents:
+            self.grant_access(
+                obj=test_document.file_latest,
+                permission=permission_document_file_tools
+            )
+
+        response = self._request_test_document_file_multiple_page_count_update_view_all()
+        self.assertEqual(response.status_code, 302)
+
+        self.assertEqual(mock_apply_async.call_count, len(self.test_documents))
+        self.assertEqual(
+            sorted(
+                call[1]['kwargs']['document_file_id_list'] for call in mock_apply_async.call_args_list
+            ), sorted(
+                [test_document.file_latest.pk] for test_document in self.test_documents
+            )
+        )
+
     def test_trashed_document_file_multiple_page_count_update_view_with_access(self):
         self.test_document_file.pages.all().delete()
         page_count = self.test_document_file.pages.count()
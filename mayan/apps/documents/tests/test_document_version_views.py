@@ -1,3 +1,5 @@
+from django.db import connection
+
 from mayan.apps.file_caching.events import event_cache_partition_purged
 from mayan.apps.file_caching.models import CachePartitionFile
 from mayan.apps.file_caching.permissions import permission_cache_partition_purge
@@ -11,6 +13,7 @@ from ..events import (
     event_document_version_edited, event_document_version_exported,
     event_document_viewed
 )
+from ..models.document_type_models import DocumentType
 from ..permissions import (
     permission_document_version_edit, permission_document_version_export,
     permission_document_version_print, permission_document_version_view
@@ -185,6 +188,47 @@ class DocumentVersionViewTestCase(
         events = self._get_test_events()
         self.assertEqual(events.count(), 0)
 
+    def test_document_version_list_view_query_count(self):
+        self.grant_access(
+            obj=self.test_document,
+            permission=permission_document_version_view
+        )
+
+        self._create_test_document_version()
+        self.test_document_version.pages_reset()
+
+        response, queries = self._request_test_document_version_list_view_with_queries()
+        self.assertEqual(response.status_code, 200)
+
+        object_list = response.context['object_list']
+        self.assertEqual(
+            object_list.query.select_related,
+            {'document': {'document_type': {}}}
+        )
+        self.assertIn('version_pages', object_list._prefetch_related_lookups)
+
+        # Document types loaded by their own query instead of being joined
+        # to the document version rows.
+        document_type_select = 'FROM {}'.format(
+            connection.ops.quote_name(name=DocumentType._meta.db_table)
+        )
+        document_type_query_count = len(
+            [query for query in queries if document_type_select in query['sql']]
+        )
+
+        for index in range(3):
+            self._create_test_document_version()
+            self.test_document_version.pages_reset()
+
+        response, queries = self._request_test_document_version_list_view_with_queries()
+        self.assertEqual(response.status_code, 200)
+
+        self.assertEqual(
+            len(
+                [query for query in queries if document_type_select in query['sql']]
+            ), document_type_query_count
+        )
+
     def test_trashed_document_version_list_view_with_access(self):
         self.grant_access(
             obj=self.test_document,
@@ -0,0 +1,55 @@
+from datetime import timedelta
+
+from django.utils.timezone import now
+
+from ..models.recently_accessed_document_models import RecentlyAccessedDocument
+
+from .base import GenericDocumentTestCase
+
+
+class RecentlyAccessedDocumentTestCase(GenericDocumentTestCase):
+    auto_upload_test_document = False
+
+    def test_recently_accessed_document_repeated_access(self):
+        self._create_test_user()
+        self._upload_test_document()
+
+        self.test_document.add_as_recent_document_for_user(
+            user=self.test_user
+        )
+        test_datetime_accessed = now() - timedelta(minutes=5)
+        RecentlyAccessedDocument.objects.update(
+            datetime_accessed=test_datetime_accessed
+        )
+
+        self.test_document.add_as_recent_document_for_user(
+            user=self.test_user
+        )
+
+        self.assertEqual(RecentlyAccessedDocument.objects.count(), 1)
+        self.assertTrue(
+            RecentlyAccessedDocument.objects.first().datetime_accessed > test_datetime_accessed
+        )
+
+    def test_recently_accessed_document_ordering(self):
+        self._create_test_user()
+        self._upload_test_document()
+        first_test_document = self.test_document
+
+        self._upload_test_document()
+
+        first_test_document.add_as_recent_document_for_user(
+            user=self.test_user
+        )
+        self.test_document.add_as_recent_document_for_user(
+            user=self.test_user
+        )
+        first_test_document.add_as_recent_document_for_user(
+            user=self.test_user
+        )
+
+        self.assertEqual(
+            RecentlyAccessedDocument.objects.filter(
+                user=self.test_user
+            ).first().document, first_test_document
+        )
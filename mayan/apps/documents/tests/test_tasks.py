@@ -0,0 +1,93 @@
+import mock
+
+from django.db import OperationalError
+
+from ..models.document_file_models import DocumentFile
+from ..tasks import task_document_file_page_count_update_bulk
+
+from .base import GenericDocumentTestCase
+
+
+class DocumentFilePageCountUpdateBulkTaskTestCase(GenericDocumentTestCase):
+    auto_upload_test_document = False
+
+    def setUp(self):
+        super().setUp()
+        self._upload_test_document()
+        self._upload_test_document()
+
+        self.test_document_files = [
+            test_document.file_latest for test_document in self.test_documents
+        ]
+
+        for test_document_file in self.test_document_files:
+            test_document_file.pages.all().delete()
+
+    def test_task_document_file_page_count_update_bulk(self):
+        task_document_file_page_count_update_bulk.apply_async(
+            kwargs={
+                'document_file_id_list': [
+                    test_document_file.pk for test_document_file in self.test_document_files
+                ]
+            }
+        )
+
+        for test_document_file in self.test_document_files:
+            self.assertNotEqual(test_document_file.pages.count(), 0)
+
+    def _execute_task_document_file_page_count_update_bulk_with_error(
+        self, exception
+    ):
+        page_count_update = DocumentFile.page_count_update
+
+        def page_count_update_side_effect(instance, *args, **kwargs):
+            if instance.pk == self.test_document_files[0].pk:
+                raise exception
+
+            return page_count_update(instance, *args, **kwargs)
+
+        with mock.patch.object(
+            target=DocumentFile, attribute='page_count_update',
+            autospec=True, side_effect=page_count_update_side_effect
+        ):
+            task_document_file_page_count_update_bulk.apply_async(
+                kwargs={
+                    'document_file_id_list': [
+                        test_document_file.pk for test_document_file in self.test_document_files
+                    ]
+                }
+            )
+
+    @mock.patch(
+        'mayan.apps.documents.tasks.task_document_file_page_count_update.apply_async'
+    )
+    def test_task_document_file_page_count_update_bulk_transient_error_requeue(
+        self, mock_apply_async
+    ):
+        self._execute_task_document_file_page_count_update_bulk_with_error(
+            exception=OperationalError('Test database error')
+        )
+
+        self.assertEqual(mock_apply_async.call_count, 1)
+        self.assertEqual(
+            mock_apply_async.call_args[1]['kwargs'],
+            {'document_file_id': self.test_document_files[0].pk}
+        )
+
+        self.assertEqual(self.test_document_files[0].pages.count(), 0)
+        self.assertNotEqual(self.test_document_files[1].pages.count(), 0)
+
+    @mock.patch(
+        'mayan.apps.documents.tasks.task_document_file_page_count_update.apply_async'
+    )
+    def test_task_document_file_page_count_update_bulk_permanent_error(
+        self, mock_apply_async
+    ):
+        self._execute_task_document_file_page_count_update_bulk_with_error(
+            exception=IOError('Test storage error')
+        )
+
+        self.assertEqual(mock_apply_async.call_count, 0)
+
+        self.assertEqual(self.test_document_files[0].pages.count(), 0)
+        self.assertNotEqual(self.test_document_files[1].pages.count(), 0)
@@ -20,6 +20,7 @@ from mayan.apps.views.utils import resolve
 from ..forms.document_file_page_forms import DocumentFilePageForm
 from ..icons import icon_document_file_page_list
 from ..links.document_file_page_links import link_document_file_page_count_update
+from ..literals import UPDATE_PAGE_COUNT_BULK_CHUNK_SIZE
 from ..models.document_file_models import DocumentFile
 from ..models.document_file_page_models import DocumentFilePage
 from ..permissions import (
@@ -29,7 +30,7 @@ from ..settings import (
     setting_rotation_step, setting_zoom_percent_step, setting_zoom_max_level,
     setting_zoom_min_level
 )
-from ..tasks import task_document_file_page_count_update
+from ..tasks import task_document_file_page_count_update_bulk
 
 __all__ = (
     'DocumentFilePageListView',
@@ -55,33 +56,67 @@ class DocumentFilePageCountUpdateView(MultipleObjectConfirmActionView):
     )
 
     def get_extra_context(self):
-        queryset = self.object_list
+        count = self.object_list.count()
 
         result = {
             'title': ungettext(
                 singular='Recalculate the page count of the selected document file?',
                 plural='Recalculate the page count of the selected document files?',
-                number=queryset.count()
+                number=count
             )
         }
 
-        if queryset.count() == 1:
+        if count == 1:
+            if self.view_mode_single:
+                instance = self.object
+            else:
+                instance = self.object_list.first()
+
             result.update(
                 {
-                    'object': queryset.first(),
+                    'object': instance,
                     'title': _(
                         'Recalculate the page count of the document file: %s?'
-                    ) % queryset.first()
+                    ) % instance
                 }
             )
 
         return result
 
-    def object_action(self, form, instance):
-        task_document_file_page_count_update.apply_async(
-            kwargs={'document_file_id': instance.pk}
+    def view_action(self, form=None):
+        # Only the primary keys are needed to queue the tasks, avoid
+        # loading full document file instances via object_action().
+        document_file_id_list = list(
+            self.object_list.values_list('pk', flat=True)
+        )
+
+        # Queue one task per chunk of document files instead of one task
+        # per document file.
+        for index in range(
+            0, len(document_file_id_list), UPDATE_PAGE_COUNT_BULK_CHUNK_SIZE
+        ):
+            task_document_file_page_count_update_bulk.apply_async(
+                kwargs={
+                    'document_file_id_list': document_file_id_list[
+                        index:index + UPDATE_PAGE_COUNT_BULK_CHUNK_SIZE
+                    ]
+                }
+            )
+
+        self.action_count = len(document_file_id_list)
+        self.action_id_list = document_file_id_list
+
+        messages.success(
+            message=self.get_success_message(count=self.action_count),
+            request=self.request
         )
 
+        # Allow get_post_object_action_url to override the redirect URL with a
+        # calculated URL after all objects are processed.
+        success_url = self.get_post_object_action_url()
+        if success_url:
+            self.success_url = success_url
+
 
 class DocumentFilePageListView(ExternalObjectViewMixin, SingleObjectListView):
     external_object_permission = permission_document_file_view
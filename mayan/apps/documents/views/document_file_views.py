@@ -33,6 +33,7 @@ from ..permissions import (
 )
 
 from .misc_views import PrintFormView, DocumentPrintView
+from .mixins import RecentDocumentViewMixin
 
 __all__ = (
     'DocumentFileDeleteView', 'DocumentFileDownloadView',
@@ -94,17 +95,18 @@ class DocumentFileDeleteView(MultipleObjectDeleteView):
 class DocumentFileDownloadView(SingleObjectDownloadView):
     object_permission = permission_document_file_download
     pk_url_kwarg = 'document_file_id'
-    source_queryset = DocumentFile.valid
 
     def get_download_file_object(self):
-        instance = self.get_object()
-        instance._event_action_object = instance.document
-        instance._event_actor = self.request.user
-        return instance.get_download_file_object()
+        self.object._event_action_object = self.object.document
+        self.object._event_actor = self.request.user
+        return self.object.get_download_file_object()
 
     def get_download_filename(self):
         return self.object.filename
 
+    def get_source_queryset(self):
+        return DocumentFile.valid.select_related('document')
+
 
 class DocumentFileEditView(SingleObjectEditView):
     form_class = DocumentFileForm
@@ -130,18 +132,16 @@ class DocumentFileEditView(SingleObjectEditView):
         )
 
 
-class DocumentFileListView(ExternalObjectViewMixin, SingleObjectListView):
+class DocumentFileListView(
+    ExternalObjectViewMixin, RecentDocumentViewMixin, SingleObjectListView
+):
     external_object_permission = permission_document_file_view
     external_object_pk_url_kwarg = 'document_id'
     external_object_queryset = Document.valid
-
-    def get_document(self):
-        document = self.external_object
-        document.add_as_recent_document_for_user(user=self.request.user)
-        return document
+    recent_document_view_document_property_name = 'external_object'
 
     def get_extra_context(self):
-        document = self.get_document()
+        document = self.external_object
         return {
             'hide_object': True,
             'list_as_items': True,
@@ -164,7 +164,7 @@ class DocumentFileListView(ExternalObjectViewMixin, SingleObjectListView):
         }
 
     def get_source_queryset(self):
-        return self.get_document().files.order_by('-timestamp')
+        return self.external_object.files.order_by('-timestamp')
 
 
 class DocumentFilePreviewView(SingleObjectDetailView):
@@ -250,22 +250,29 @@ class DocumentFileTransformationsClearView(MultipleObjectConfirmActionView):
     )
 
     def get_extra_context(self):
+        count = self.object_list.count()
+
         result = {
             'title': ungettext(
                 singular='Clear all the page transformations for the selected document file?',
                 plural='Clear all the page transformations for the selected document files?',
-                number=self.object_list.count()
+                number=count
             )
         }
 
-        if self.object_list.count() == 1:
+        if count == 1:
+            if self.view_mode_single:
+                instance = self.object
+            else:
+                instance = self.object_list.first()
+
             result.update(
                 {
-                    'object': self.object_list.first(),
+                    'object': instance,
                     'title': _(
                         'Clear all the page transformations for the '
                         'document file: %s?'
-                    ) % self.object_list.first()
+                    ) % instance
                 }
             )
 
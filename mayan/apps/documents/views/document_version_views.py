@@ -1,11 +1,14 @@
 import logging
 
+from celery import group
+
 from django.conf import settings
 from django.contrib import messages
 from django.template import RequestContext
 from django.urls import reverse
 from django.utils.translation import ugettext_lazy as _, ungettext
 
+from mayan.apps.common.classes import ModelQueryFields
 from mayan.apps.converter.layers import layer_saved_transformations
 from mayan.apps.converter.permissions import (
     permission_transformation_delete, permission_transformation_edit
@@ -18,7 +21,6 @@ from mayan.apps.views.generics import (
 )
 from mayan.apps.views.mixins import ExternalObjectViewMixin
 
-from ..events import event_document_viewed
 from ..forms.document_version_forms import (
     DocumentVersionForm, DocumentVersionPreviewForm
 )
@@ -32,7 +34,9 @@ from ..permissions import (
     permission_document_version_edit, permission_document_version_export,
     permission_document_version_print, permission_document_version_view
 )
-from ..tasks import task_document_version_export
+from ..tasks import (
+    task_document_version_event_viewed_commit, task_document_version_export
+)
 
 from .misc_views import PrintFormView, DocumentPrintView
 from .mixins import RecentDocumentViewMixin
@@ -148,7 +152,6 @@ class DocumentVersionEditView(SingleObjectEditView):
 class DocumentVersionExportView(MultipleObjectConfirmActionView):
     object_permission = permission_document_version_export
     pk_url_kwarg = 'document_version_id'
-    source_queryset = DocumentVersion.valid
     success_message_single = _(
         'Document version "%(object)s" export successfully queued.'
     )
@@ -171,20 +174,36 @@ class DocumentVersionExportView(MultipleObjectConfirmActionView):
         }
 
         if self.object_list.count() == 1:
-            context['object'] = self.object_list.first()
+            if self.view_mode_single:
+                context['object'] = self.object
+            else:
+                context['object'] = self.object_list.first()
 
         return context
 
+    def get_source_queryset(self):
+        return DocumentVersion.valid.select_related('document')
+
     def object_action(self, form, instance):
-        task_document_version_export.apply_async(
-            kwargs={
-                'document_version_id': instance.pk,
-                'organization_installation_url': get_organization_installation_url(
-                    request=self.request
-                ),
-                'user_id': self.request.user.pk
-            }
+        self.task_signature_list.append(
+            task_document_version_export.s(
+                document_version_id=instance.pk,
+                organization_installation_url=self.organization_installation_url,
+                user_id=self.request.user.pk
+            )
+        )
+
+    def view_action(self, form=None):
+        # Collect one task signature per document version and publish them
+        # to the broker as a single group.
+        self.organization_installation_url = get_organization_installation_url(
+            request=self.request
         )
+        self.task_signature_list = []
+
+        super().view_action(form=form)
+
+        group(self.task_signature_list).apply_async()
 
 
 class DocumentVersionListView(
@@ -217,23 +236,30 @@ class DocumentVersionListView(
         }
 
     def get_source_queryset(self):
-        return self.external_object.versions.order_by('-timestamp')
+        queryset = ModelQueryFields.get(model=DocumentVersion).get_queryset()
+        # The version columns are all displayed. The free form description
+        # of the joined document is not, leave it out of the SELECT.
+        return queryset.filter(
+            document=self.external_object
+        ).defer('document__description').order_by('-timestamp')
 
 
 class DocumentVersionPreviewView(SingleObjectDetailView):
     form_class = DocumentVersionPreviewForm
     object_permission = permission_document_version_view
     pk_url_kwarg = 'document_version_id'
-    source_queryset = DocumentVersion.valid
 
     def dispatch(self, request, *args, **kwargs):
         result = super().dispatch(request, *args, **kwargs)
         self.object.document.add_as_recent_document_for_user(
             user=request.user
         )
-        event_document_viewed.commit(
-            actor=request.user, action_object=self.object,
-            target=self.object.document
+        # Commit the view event from a worker, outside of the request.
+        task_document_version_event_viewed_commit.apply_async(
+            kwargs={
+                'document_version_id': self.object.pk,
+                'user_id': request.user.pk
+            }
         )
 
         return result
@@ -245,6 +271,11 @@ class DocumentVersionPreviewView(SingleObjectDetailView):
             'title': _('Preview of document version: %s') % self.object,
         }
 
+    def get_source_queryset(self):
+        return DocumentVersion.valid.select_related(
+            'document', 'document__document_type'
+        )
+
 
 class DocumentVersionPrintFormView(PrintFormView):
     external_object_permission = permission_document_version_print
@@ -282,22 +313,29 @@ class DocumentVersionTransformationsClearView(MultipleObjectConfirmActionView):
     )
 
     def get_extra_context(self):
+        count = self.object_list.count()
+
         result = {
             'title': ungettext(
                 singular='Clear all the page transformations for the selected document version?',
                 plural='Clear all the page transformations for the selected document version?',
-                number=self.object_list.count()
+                number=count
             )
         }
 
-        if self.object_list.count() == 1:
+        if count == 1:
+            if self.view_mode_single:
+                instance = self.object
+            else:
+                instance = self.object_list.first()
+
             result.update(
                 {
-                    'object': self.object_list.first(),
+                    'object': instance,
                     'title': _(
                         'Clear all the page transformations for the '
                         'document version: %s?'
-                    ) % self.object_list.first()
+                    ) % instance
                 }
             )
 